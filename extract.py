@@ -30,13 +30,9 @@ def load_neos(neo_csv_path):
             name = str(line["name"]) if line["name"] != "" else None
             dia = float(line["diameter"]
                         ) if line["diameter"] != "" else float("nan")
-            haz = True if line["pha"] == "Y" else False
+            haz = line["pha"] == "Y"
 
-            neos.append(
-                NearEarthObject(
-                    designation=pdes, name=name, diameter=dia, hazardous=haz
-                )
-            )
+            neos.append(NearEarthObject(pdes, name, dia, haz))
     return neos
 
 
@@ -54,9 +50,6 @@ def load_approaches(cad_json_path):
             time = line[3]
             dist = line[4]
             vel = line[7]
-            approaches.append(
-                CloseApproach(designation=pdes, time=time,
-                              distance=dist, velocity=vel)
-            )
+            approaches.append(CloseApproach(pdes, time, dist, vel))
 
     return approaches
@@ -23,11 +23,12 @@ The `query` subcommand searches for close approaches that match given criteria:
     $ python3 main.py query --start-date 2000-01-01 --max-diameter 0.1 --not-hazardous
     $ python3 main.py query --hazardous --max-distance 0.05 --min-velocity 30
 
-The set of results can be limited in size and/or saved to an output file in CSV
-or JSON format:
+The set of results can be limited in size and/or saved to an output file in CSV,
+JSON or Parquet format:
 
     $ python3 main.py query --limit 5 --outfile results.csv
     $ python3 main.py query --limit 15 --outfile results.json
+    $ python3 main.py query --outfile results.parquet
 
 The `interactive` subcommand loads the NEO database and spawns an interactive
 command shell that can repeatedly execute `inspect` and `query` commands without
@@ -47,7 +48,7 @@ import time
 from extract import load_neos, load_approaches
 from database import NEODatabase
 from filters import create_filters, limit
-from write import write_to_csv, write_to_json
+from write import write_to_csv, write_to_json, write_to_parquet
 
 
 # Paths to the root of the project and the `data` subfolder.
@@ -203,8 +204,8 @@ def query(database, args):
 
     If an output file wasn't given, print these results to stdout, limiting to
     10 entries if no limit was specified. If an output file was given, use the
-    file's extension to infer whether the file should hold CSV or JSON data, and
-    then write the results to the output file in that format.
+    file's extension to infer whether the file should hold CSV, JSON or Parquet
+    data, and then write the results to the output file in that format.
 
     :param database: The `NEODatabase` containing data on NEOs and their close approaches.
     :param args: All arguments from the command line, as parsed by the top-level parser.
@@ -230,8 +231,15 @@ def query(database, args):
             write_to_csv(limit(results, args.limit), args.outfile)
         elif args.outfile.suffix == '.json':
             write_to_json(limit(results, args.limit), args.outfile)
+        elif args.outfile.suffix == '.parquet':
+            try:
+                write_to_parquet(limit(results, args.limit), args.outfile)
+            except ImportError:
+                print("Writing a `.parquet` file requires the `pyarrow` package.",
+                      file=sys.stderr)
         else:
-            print("Please use an output file that ends with `.csv` or `.json`.", file=sys.stderr)
+            print("Please use an output file that ends with `.csv`, `.json` or `.parquet`.",
+                  file=sys.stderr)
 
 
 class NEOShell(cmd.Cmd):
@@ -15,6 +15,8 @@ The functions that construct these objects use information extracted from the
 data files from NASA, so these objects should be able to handle all of the
 quirks of the data set, such as missing names and unknown diameters.
 """
+import math
+
 from helpers import cd_to_datetime, datetime_to_str
 
 
@@ -29,46 +31,62 @@ class NearEarthObject:
     A `NearEarthObject` also maintains a collection of its close approaches -
     initialized to an empty collection, but eventually populated in the
     `NEODatabase` constructor.
+
+    Apart from `approaches`, a `NearEarthObject` is treated as immutable after
+    construction: `fullname`, `has_diameter` and the cached `repr` (which every
+    linked `CloseApproach` also embeds in its own) are derived from the other
+    attributes only once, so reassigning `name`, `diameter` or `hazardous`
+    leaves them stale.
     """
 
-    def __init__(self, designation, **info):
+    __slots__ = (
+        "designation",
+        "name",
+        "diameter",
+        "hazardous",
+        "has_diameter",
+        "fullname",
+        "approaches",
+        "_repr",
+    )
+
+    def __init__(self, designation, name=None, diameter=float("nan"), hazardous=False):
         """Create a new `NearEarthObject`.
 
-        :param pdes: primary designation (required, unique)
-        :param info: A dictionary of excess keyword arguments supplied to the constructor.
+        :param designation: primary designation (required, unique)
+        :param name: IAU name, or None if the NEO has no name
+        :param diameter: diameter in kilometers, or NaN if unknown
+        :param hazardous: whether the NEO is potentially hazardous
         """
-        # designation is the "ID" of this object so only the intended use is permitted
+        # designation is the "ID" of this object; the loader always supplies a string
         self.designation = designation
-        assert isinstance(self.designation, str)
 
         # name and diameter are less important so I can cast them
-        self.name = info["name"] if "name" in info.keys() else None
-        self.diameter = (
-            float(info["diameter"]
-                  ) if "diameter" in info.keys() else float("nan")
-        )
-        self.hazardous = info["hazardous"] if "hazardous" in info.keys(
-        ) else False
-
-        # Create an empty initial collection of linked approaches.
-        self.approaches = []
+        self.name = name
+        self.diameter = float(diameter)
+        self.hazardous = bool(hazardous)
 
-    @property
-    def fullname(self):
-        """Return a representation of the full name of this NEO."""
-        return (
+        # These never change after construction, so compute them only once.
+        self.fullname = (
             self.designation + ", " + self.name
             if self.name is not None
             else self.designation
         )
+        # an unknown diameter is stored as "nan"
+        self.has_diameter = not math.isnan(self.diameter)
+
+        # Create an empty initial collection of linked approaches.
+        self.approaches = []
+
+        # `repr(self)` is built on first use and then reused.
+        self._repr = None
 
     def __str__(self):
         """Return `str(self)`."""
         text = f"A NearEarthObject with designation {self.designation}."
         if self.name is not None:
             text += f" It's name is {self.name}"
-        # check that diameter is not "nan"
-        if self.diameter == self.diameter:
+        if self.has_diameter:
             text += f" It has a diameter of {self.diameter}m."
         if self.hazardous:
             text += " It is endangering us all!"
@@ -78,10 +96,12 @@ class NearEarthObject:
 
     def __repr__(self):
         """Return `repr(self)`, a computer-readable string representation of this object."""
-        return (
-            f"NearEarthObject(designation={self.designation!r}, name={self.name!r}, "
-            f"diameter={self.diameter:.3f}, hazardous={self.hazardous!r})"
-        )
+        if self._repr is None:
+            self._repr = (
+                f"NearEarthObject(designation={self.designation!r}, name={self.name!r}, "
+                f"diameter={self.diameter:.3f}, hazardous={self.hazardous!r})"
+            )
+        return self._repr
 
 
 class CloseApproach:
@@ -96,39 +116,67 @@ class CloseApproach:
     initially, this information (the NEO's primary designation) is saved in a
     private attribute, but the referenced NEO is eventually replaced in the
     `NEODatabase` constructor.
+
+    Apart from linking `neo`, a `CloseApproach` is treated as immutable after
+    construction: `time_str` is derived from `time` only once, and the `repr` is
+    cached the first time it is built with a linked NEO.
     """
 
-    def __init__(self, designation, time, **info):
+    __slots__ = (
+        "_designation",
+        "time",
+        "distance",
+        "velocity",
+        "neo",
+        "time_str",
+        "_repr",
+    )
+
+    def __init__(self, designation, time, distance=0.0, velocity=0.0):
         """Create a new `CloseApproach`.
 
         :param designation: Designation of CloseApproach as a string
         :param time: A calendar date in YYYY-bb-DD hh:mm format
-        :param info: A dictionary of excess keyword arguments supplied to the constructor.
+        :param distance: Nominal approach distance in astronomical units
+        :param velocity: Relative approach velocity in kilometers per second
         """
         self._designation = designation
         self.time = cd_to_datetime(time)
-        self.distance = float(
-            info["distance"]) if "distance" in info.keys() else 0.0
-        self.velocity = float(
-            info["velocity"]) if "velocity" in info.keys() else 0.0
+        self.distance = float(distance)
+        self.velocity = float(velocity)
 
         # Create an attribute for the referenced NEO, originally None.
         self.neo = None
 
-    @property
-    def time_str(self):
-        """Return a formatted representation of this `CloseApproach`'s approach time.
+        # The default string representation of a `datetime` includes seconds,
+        # which don't exist in our input data set, so format it once here for
+        # use in human-readable representations and in serialization.
+        self.time_str = datetime_to_str(self.time)
+
+        # `repr(self)` is built on first use once the NEO is linked, then reused.
+        self._repr = None
+
+    def _serialize(self):
+        """Return the values written for this `CloseApproach` by the output writers.
 
-        The value in `self.time` should be a Python `datetime` object. While a
-        `datetime` object has a string representation, the default representation
-        includes seconds - significant figures that don't exist in our input
-        data set.
+        The tuple holds, in output column order: the approach time as formatted
+        by `datetime_to_str`, distance, velocity, designation, name (None if the
+        NEO has none), diameter (NaN if unknown) and the hazardous flag. Each
+        writer maps the missing values to its own format. The NEO must already
+        be linked.
 
-        The `datetime_to_str` method converts a `datetime` object to a
-        formatted string that can be used in human-readable representations and
-        in serialization to CSV and JSON files.
+        :return: A tuple of serializable values.
         """
-        return datetime_to_str(self.time)
+        neo = self.neo
+        return (
+            self.time_str,
+            self.distance,
+            self.velocity,
+            self._designation,
+            neo.name,
+            neo.diameter,
+            neo.hazardous,
+        )
 
     def __str__(self):
         """Return `str(self)`."""
@@ -143,7 +191,13 @@ class CloseApproach:
 
     def __repr__(self):
         """Return `repr(self)`, a computer-readable string representation of this object."""
-        return (
+        if self._repr is not None:
+            return self._repr
+        text = (
             f"CloseApproach(time={self.time_str!r}, distance={self.distance:.2f}, "
             f"velocity={self.velocity:.2f}, neo={self.neo!r})"
         )
+        # The NEO is linked after construction, so don't cache `neo=None`.
+        if self.neo is not None:
+            self._repr = text
+        return text
@@ -21,13 +21,20 @@ import datetime
 import io
 import json
 import pathlib
+import tempfile
 import unittest
 import unittest.mock
 
 
 from extract import load_neos, load_approaches
 from database import NEODatabase
-from write import write_to_csv, write_to_json
+from models import NearEarthObject, CloseApproach
+from write import write_to_csv, write_to_json, write_to_parquet
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
 
 
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
@@ -65,6 +72,15 @@ def UncloseableStringIO(value=''):
     buf.close()
 
 
+@unittest.mock.patch('write.open')
+def write_to_string(writer, results, mock_file):
+    """Run `writer` on `results` and return everything it wrote to its file."""
+    with UncloseableStringIO() as buf:
+        mock_file.return_value = buf
+        writer(results, None)
+        return buf.getvalue()
+
+
 class TestWriteToCSV(unittest.TestCase):
     @classmethod
     @unittest.mock.patch('write.open')
@@ -226,5 +242,104 @@ class TestWriteToJSON(unittest.TestCase):
         self.assertIsInstance(approach['neo']['potentially_hazardous'], bool)
 
 
+def build_named_approach(designation, name):
+    """Build a `CloseApproach` linked to a new NEO with the given designation and name.
+
+    The test data files have no names or designations that need CSV quoting, so
+    this lets tests exercise the `csv.writer` fallback in `write_to_csv`.
+    """
+    neo = NearEarthObject(designation, name, 1.5, True)
+    approach = CloseApproach(designation, '2020-Jan-01 00:00', 0.1, 10.0)
+    approach.neo = neo
+    neo.approaches.append(approach)
+    return approach
+
+
+class TestWriteToCSVQuoting(unittest.TestCase):
+    def test_csv_name_needing_quotes_round_trips(self):
+        results = [build_named_approach('1', 'Foo, "Bar"')]
+        rows = tuple(csv.reader(io.StringIO(write_to_string(write_to_csv, results))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][3], '1')
+        self.assertEqual(rows[1][4], 'Foo, "Bar"')
+
+    def test_csv_designation_needing_quotes_round_trips(self):
+        results = [build_named_approach('1, "2"', None)]
+        rows = tuple(csv.reader(io.StringIO(write_to_string(write_to_csv, results))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][3], '1, "2"')
+        self.assertEqual(rows[1][4], '')
+
+    def test_csv_mixed_rows_keep_their_order(self):
+        names = (None, 'Foo, "Bar"', 'Eros', 'Line\r\nBreak', 'Quote"d', 'Plain')
+        results = [build_named_approach(str(i), name) for i, name in enumerate(names)]
+        rows = tuple(csv.DictReader(io.StringIO(write_to_string(write_to_csv, results))))
+        self.assertEqual([row['designation'] for row in rows], [str(i) for i in range(len(names))])
+        self.assertEqual([row['name'] for row in rows], [name or '' for name in names])
+
+
+class TestWriteGenerators(unittest.TestCase):
+    # `main.query` passes the `limit` generator, not a sequence, to the writers.
+    def test_csv_accepts_generator(self):
+        results = build_results(5)
+        value = write_to_string(write_to_csv, (approach for approach in results))
+        rows = tuple(csv.DictReader(io.StringIO(value)))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['designation'], results[0]._designation)
+
+    def test_csv_accepts_empty_generator(self):
+        value = write_to_string(write_to_csv, (approach for approach in ()))
+        rows = tuple(csv.reader(io.StringIO(value)))
+        self.assertEqual(len(rows), 1)
+        self.assertIn('datetime_utc', rows[0])
+
+    def test_json_accepts_generator(self):
+        results = build_results(5)
+        value = write_to_string(write_to_json, (approach for approach in results))
+        data = json.loads(value)
+        self.assertEqual(len(data), 5)
+        self.assertEqual(data[0]['neo']['designation'], results[0]._designation)
+
+    def test_json_accepts_empty_generator(self):
+        value = write_to_string(write_to_json, (approach for approach in ()))
+        self.assertEqual(json.loads(value), [])
+
+
+@unittest.skipIf(pyarrow is None, "The optional `pyarrow` package is not installed.")
+class TestWriteToParquet(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.results = results = build_results(5)
+
+        # Parquet is a binary format written by pyarrow itself, so use a real file.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / 'results.parquet'
+            write_to_parquet(results, path)
+            cls.table = pyarrow.parquet.read_table(path)
+
+    def test_parquet_data_has_five_rows(self):
+        self.assertEqual(self.table.num_rows, 5)
+
+    def test_parquet_data_columns_match_requirements(self):
+        fieldnames = ('datetime_utc', 'distance_au', 'velocity_km_s', 'designation', 'name', 'diameter_km', 'potentially_hazardous')
+        self.assertSequenceEqual(tuple(self.table.column_names), fieldnames)
+
+    def test_parquet_element_decodes_to_correct_types(self):
+        approach = self.table.slice(0, 1).to_pylist()[0]
+        self.assertIsInstance(approach['datetime_utc'], datetime.datetime)
+        self.assertIsInstance(approach['distance_au'], float)
+        self.assertIsInstance(approach['velocity_km_s'], float)
+        self.assertIsInstance(approach['designation'], str)
+        if approach['name'] is not None:
+            self.assertIsInstance(approach['name'], str)
+        self.assertIsInstance(approach['diameter_km'], float)
+        self.assertIsInstance(approach['potentially_hazardous'], bool)
+
+    def test_parquet_missing_name_is_null(self):
+        names = self.table.column('name').to_pylist()
+        self.assertEqual(names, [approach.neo.name for approach in self.results])
+        self.assertIn(None, names)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,8 @@
-"""Write a stream of close approaches to CSV or to JSON.
+"""Write a stream of close approaches to CSV, to JSON, or to Parquet.
 
-This module exports two functions: `write_to_csv` and `write_to_json`, each of
-which accept an `results` stream of close approaches and a path to which to
-write the data.
+This module exports three functions: `write_to_csv`, `write_to_json` and
+`write_to_parquet`, each of which accept an `results` stream of close approaches
+and a path to which to write the data.
 
 These functions are invoked by the main module with the output of the `limit`
 function and the filename supplied by the user at the command line. The file's
@@ -11,8 +11,39 @@ extension determines which of these functions is used.
 You'll edit this file in Part 4.
 """
 import csv
+import itertools
 import json
-import helpers
+import math
+
+from models import CloseApproach
+
+# A large write buffer amortizes the cost of the underlying write syscalls.
+_BUFFER_SIZE = 1 << 20
+
+# Number of close approaches collected into each Parquet row group.
+_PARQUET_BATCH_SIZE = 1 << 16
+
+# Characters that force `csv.writer` to quote a field under its default dialect.
+_CSV_SPECIAL_CHARS = frozenset(',"\r\n')
+
+
+def _fill_json_record(row, obj_dict, neo_dict):
+    """Overwrite the reusable JSON record dictionaries with one approach's values.
+
+    :param row: The tuple returned by `CloseApproach._serialize`.
+    :param obj_dict: The outer record dictionary, whose 'neo' key maps to `neo_dict`.
+    :param neo_dict: The nested NEO dictionary.
+    :return: `obj_dict`, ready to be encoded.
+    """
+    time_str, distance, velocity, designation, name, diameter, hazardous = row
+    neo_dict["designation"] = designation
+    neo_dict["name"] = name if name is not None else ""
+    neo_dict["diameter_km"] = diameter
+    neo_dict["potentially_hazardous"] = hazardous
+    obj_dict["datetime_utc"] = time_str
+    obj_dict["distance_au"] = distance
+    obj_dict["velocity_km_s"] = velocity
+    return obj_dict
 
 
 def write_to_csv(results, filename):
@@ -35,22 +66,29 @@ def write_to_csv(results, filename):
         "potentially_hazardous",
     )
     # Write the results to a CSV file, following the specification in the instructions.
-    with open(filename, "w") as f:
+    with open(filename, "w", buffering=_BUFFER_SIZE, newline="") as f:
         writer = csv.writer(f)
         writer.writerow(fieldnames)
-        for o in results:
-            name = o.neo.name if o.neo.name is not None else ""
-            dia = o.neo.diameter if o.neo.diameter == o.neo.diameter else ""
-            line = (
-                o.time,
-                o.distance,
-                o.velocity,
-                o._designation,
-                name,
-                dia,
-                o.neo.hazardous,
+        # Only the name and designation are free text that may need quoting,
+        # so rows where neither does are formatted directly and `csv.writer`
+        # handles the rest.
+        lineterminator = writer.dialect.lineterminator
+        for row in map(CloseApproach._serialize, results):
+            time_str, distance, velocity, designation, name, diameter, hazardous = row
+            if name is None:
+                name = ""
+            if math.isnan(diameter):
+                diameter = ""
+            if not (_CSV_SPECIAL_CHARS.isdisjoint(name)
+                    and _CSV_SPECIAL_CHARS.isdisjoint(designation)):
+                writer.writerow(
+                    (time_str, distance, velocity, designation, name, diameter, hazardous)
+                )
+                continue
+            f.write(
+                f"{time_str},{distance},{velocity},{designation},"
+                f"{name},{diameter},{hazardous}{lineterminator}"
             )
-            writer.writerow(line)
 
 
 def write_to_json(results, filename):
@@ -65,21 +103,89 @@ def write_to_json(results, filename):
     :param filename: A Path-like object pointing to where the data should be saved.
     """
     # Write the results to a JSON file, following the specification in the instructions.
-    with open(filename, "w") as f:
-        if len(results) == 0:
-            json.dump([], f)
-        else:
-            top_lvl_list = []
-            for o in results:
-                neo_dict = {}
-                neo_dict["designation"] = o.neo.designation
-                neo_dict["name"] = o.neo.name if o.neo.name is not None else ""
-                neo_dict["diameter_km"] = o.neo.diameter
-                neo_dict["potentially_hazardous"] = True if o.neo.hazardous else False
-                obj_dict = {}
-                obj_dict["datetime_utc"] = helpers.datetime_to_str(o.time)
-                obj_dict["distance_au"] = o.distance
-                obj_dict["velocity_km_s"] = o.velocity
-                obj_dict["neo"] = neo_dict
-                top_lvl_list.append(obj_dict)
-            json.dump(top_lvl_list, f)
+    # Records are streamed one at a time so the full result set is never held in memory.
+    encoder = json.JSONEncoder(check_circular=False)
+    # Each record is encoded before the next one is filled in, so the same two
+    # dictionaries can be reused for every close approach.
+    neo_dict = {
+        "designation": None,
+        "name": None,
+        "diameter_km": None,
+        "potentially_hazardous": None,
+    }
+    obj_dict = {
+        "datetime_utc": None,
+        "distance_au": None,
+        "velocity_km_s": None,
+        "neo": neo_dict,
+    }
+    with open(filename, "w", buffering=_BUFFER_SIZE) as f:
+        # Peek at the first result so any iterable, including a generator, works.
+        rows = map(CloseApproach._serialize, results)
+        first = next(rows, None)
+        if first is None:
+            f.write("[]")
+            return
+        f.write("[")
+        f.write(encoder.encode(_fill_json_record(first, obj_dict, neo_dict)))
+        for row in rows:
+            f.write(",\n")
+            f.write(encoder.encode(_fill_json_record(row, obj_dict, neo_dict)))
+        f.write("]")
+
+
+def _parquet_table(rows, schema):
+    """Transpose a batch of `CloseApproach._serialize` tuples into a `pyarrow.Table`.
+
+    :param rows: A list of tuples whose values follow the order of `schema`.
+    :param schema: The `pyarrow.Schema` of the Parquet file.
+    :return: A `pyarrow.Table` holding `rows`.
+    """
+    import pyarrow
+    import pyarrow.compute
+
+    time_strs, *columns = zip(*rows)
+    # Parse the formatted approach times back into a typed column in one C-level pass.
+    arrays = [pyarrow.compute.strptime(
+        pyarrow.array(time_strs, type=pyarrow.string()), format="%Y-%m-%d %H:%M", unit="s"
+    )]
+    arrays.extend(
+        pyarrow.array(column, type=field.type) for column, field in zip(columns, list(schema)[1:])
+    )
+    return pyarrow.Table.from_arrays(arrays, schema=schema)
+
+
+def write_to_parquet(results, filename):
+    """Write an iterable of `CloseApproach` objects to a Parquet file.
+
+    The columns match those of `write_to_csv`, but are stored typed and
+    compressed: `datetime_utc` is a timestamp, `name` is null when the NEO has
+    none, `diameter_km` is a float that is NaN when unknown, and
+    `potentially_hazardous` is a boolean. Results are written in batches, so the
+    full result set is never held in memory.
+
+    This requires the optional `pyarrow` package.
+
+    :param results: An iterable of `CloseApproach` objects.
+    :param filename: A Path-like object pointing to where the data should be saved.
+    """
+    # pyarrow is only needed for this output format, so import it lazily.
+    import pyarrow
+    import pyarrow.parquet
+
+    schema = pyarrow.schema([
+        ("datetime_utc", pyarrow.timestamp("s")),
+        ("distance_au", pyarrow.float64()),
+        ("velocity_km_s", pyarrow.float64()),
+        ("designation", pyarrow.string()),
+        ("name", pyarrow.string()),
+        ("diameter_km", pyarrow.float64()),
+        ("potentially_hazardous", pyarrow.bool_()),
+    ])
+    with pyarrow.parquet.ParquetWriter(filename, schema, compression="zstd") as writer:
+        rows = map(CloseApproach._serialize, results)
+        while True:
+            batch = list(itertools.islice(rows, _PARQUET_BATCH_SIZE))
+            if not batch:
+                break
+            writer.write_table(_parquet_table(batch, schema))